@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import copy
 import logging
+import math
 import warnings
 from typing import Any
 from typing import cast
@@ -158,9 +159,16 @@ class Circuit(DifferentiableUnitary, StateVectorMap, Collection[Operation]):
                 ' %d != %d' % (len(self.radixes), self.num_qudits),
             )
 
+        self._dim = int(math.prod(self.radixes))
         self._circuit: list[list[Operation | None]] = []
         self._gate_info: dict[Gate, int] = {}
         self._graph_info: dict[tuple[int, int], int] = {}
+        self._coupling_graph: CouplingGraph | None = None
+        self._gate_set: GateSet | None = None
+        self._num_params = 0
+        self._num_operations = 0
+        self._num_op_qudits = 0
+        self._qudit_depths: npt.NDArray[np.int32] | None = None
 
         _NodePtrs = Dict[int, Optional[CircuitPoint]]
         self._front: _NodePtrs = {i: None for i in range(self.num_qudits)}
@@ -172,18 +180,12 @@ class Circuit(DifferentiableUnitary, StateVectorMap, Collection[Operation]):
     @property
     def num_params(self) -> int:
         """The total number of parameters in the circuit."""
-        num_params_acm = 0
-        for gate, count in self._gate_info.items():
-            num_params_acm += gate.num_params * count
-        return num_params_acm
+        return self._num_params
 
     @property
     def num_operations(self) -> int:
         """The total number of operations in the circuit."""
-        num_gates_acm = 0
-        for _, count in self._gate_info.items():
-            num_gates_acm += count
-        return num_gates_acm
+        return self._num_operations
 
     @property
     def num_cycles(self) -> int:
@@ -193,16 +195,26 @@ class Circuit(DifferentiableUnitary, StateVectorMap, Collection[Operation]):
     @property
     def params(self) -> npt.NDArray[np.float64]:
         """The stored parameters for the circuit."""
-        return np.array(sum((list(op.params) for op in self), []))
+        params = np.empty(self.num_params, dtype=np.float64)
+        if self.num_params == 0:
+            return params
+
+        offset = 0
+        for op in self:
+            params[offset:offset + op.num_params] = op.params
+            offset += op.num_params
+        return params
 
     @property
     def depth(self) -> int:
         """The length of the critical path in the circuit."""
-        qudit_depths = np.zeros(self.num_qudits, dtype=int)
-        for op in self:
-            new_depth = max(qudit_depths[list(op.location)]) + 1
-            qudit_depths[list(op.location)] = new_depth
-        return int(max(qudit_depths))
+        if self._qudit_depths is None:
+            qudit_depths = np.zeros(self.num_qudits, dtype=np.int32)
+            for op in self:
+                new_depth = max(qudit_depths[list(op.location)]) + 1
+                qudit_depths[list(op.location)] = new_depth
+            self._qudit_depths = qudit_depths
+        return int(self._qudit_depths.max())
 
     @property
     def multi_qudit_depth(self) -> int:
@@ -218,17 +230,10 @@ class Circuit(DifferentiableUnitary, StateVectorMap, Collection[Operation]):
     @property
     def parallelism(self) -> float:
         """The amount of parallelism in the circuit."""
-        depth = self.depth
-
-        if depth == 0:
-            return 0
+        if self._num_operations == 0:
+            return 0.0
 
-        weighted_num_operations = np.sum([
-            gate.num_qudits * count
-            for gate, count in self._gate_info.items()
-        ])
-
-        return float(weighted_num_operations / depth)
+        return self._num_op_qudits / self.depth
 
     @property
     def coupling_graph(self) -> CouplingGraph:
@@ -242,13 +247,18 @@ class Circuit(DifferentiableUnitary, StateVectorMap, Collection[Operation]):
             - Logical multi-qudit gates require participating qudits to
                 have all-to-all connectivity.
         """
-        return CouplingGraph(self._graph_info.keys(), self.num_qudits)
+        if self._coupling_graph is None:
+            graph = CouplingGraph(self._graph_info.keys(), self.num_qudits)
+            self._coupling_graph = graph
+        return self._coupling_graph
 
     @property
     def gate_set(self) -> GateSet:
         """The set of gates in the circuit."""
-        from bqskit.compiler.gateset import GateSet
-        return GateSet(set(self._gate_info.keys()))
+        if self._gate_set is None:
+            from bqskit.compiler.gateset import GateSet
+            self._gate_set = GateSet(self._gate_info.keys())
+        return self._gate_set
 
     @property
     def gate_set_no_blocks(self) -> GateSet:
@@ -266,7 +276,7 @@ class Circuit(DifferentiableUnitary, StateVectorMap, Collection[Operation]):
     @property
     def gate_counts(self) -> dict[Gate, int]:
         """The count of each type of gate in the circuit."""
-        return {gate: self.count(gate) for gate in self.gate_set}
+        return dict(self._gate_info)
 
     @property
     def active_qudits(self) -> list[int]:
@@ -286,7 +296,7 @@ class Circuit(DifferentiableUnitary, StateVectorMap, Collection[Operation]):
         """Check if all gates are differentiable."""
         return all(
             isinstance(gate, DifferentiableUnitary)
-            for gate in self.gate_set
+            for gate in self._gate_info
         )
 
     # endregion
@@ -312,12 +322,15 @@ class Circuit(DifferentiableUnitary, StateVectorMap, Collection[Operation]):
 
         self._num_qudits += 1
         self._radixes = self.radixes + (radix,)
+        self._dim *= int(radix)
 
         for cycle in self._circuit:
             cycle.append(None)
 
         self._rear[self.num_qudits - 1] = None
         self._front[self.num_qudits - 1] = None
+        self._qudit_depths = None
+        self._coupling_graph = None
 
     def extend_qudits(self, radixes: Iterable[int]) -> None:
         """
@@ -370,6 +383,9 @@ class Circuit(DifferentiableUnitary, StateVectorMap, Collection[Operation]):
         radix_list = list(self.radixes)
         radix_list.insert(qudit_index, radix)
         self._radixes = tuple(radix_list)
+        self._dim *= int(radix)
+        self._qudit_depths = None
+        self._coupling_graph = None
 
         # Insert qudit
         shift_index = lambda q: q if q < qudit_index else q + 1
@@ -460,8 +476,10 @@ class Circuit(DifferentiableUnitary, StateVectorMap, Collection[Operation]):
         # Update circuit properties
         self._num_qudits -= 1
         radix_list = list(self.radixes)
-        radix_list.pop(qudit_index)
+        self._dim //= int(radix_list.pop(qudit_index))
         self._radixes = tuple(radix_list)
+        self._qudit_depths = None
+        self._coupling_graph = None
 
         # Remove qudit
         shift_index = lambda q: q if q < qudit_index else q - 1
@@ -573,6 +591,9 @@ class Circuit(DifferentiableUnitary, StateVectorMap, Collection[Operation]):
         perm_point = lambda p: CircuitPoint(p.cycle, perm[p.qudit])
         perm_point_or_none = lambda p: perm_point(p) if p is not None else p
 
+        if self._qudit_depths is not None:
+            self._qudit_depths[perm] = self._qudit_depths.copy()
+        self._coupling_graph = None
         self._graph_info = {
             (perm[e[0]], perm[e[1]]): i
             for e, i in self._graph_info.items()
@@ -919,7 +940,7 @@ class Circuit(DifferentiableUnitary, StateVectorMap, Collection[Operation]):
         if not isinstance(op, Operation):
             raise TypeError('Expected Operation got %s.' % type(op))
 
-        if not all([qudit < self.num_qudits for qudit in op.location]):
+        if any(qudit >= self.num_qudits for qudit in op.location):
             raise ValueError('Operation location mismatch with Circuit.')
 
         for op_radix, circ_radix_idx in zip(op.radixes, op.location):
@@ -1089,12 +1110,23 @@ class Circuit(DifferentiableUnitary, StateVectorMap, Collection[Operation]):
         for pair in op.location.pairs:
             if pair not in self._graph_info:
                 self._graph_info[pair] = 0
+                self._coupling_graph = None
             self._graph_info[pair] += 1
 
         # Update _gate_info
-        if op.gate not in self._gate_info:
-            self._gate_info[op.gate] = 0
-        self._gate_info[op.gate] += 1
+        count = self._gate_info.get(op.gate, 0)
+        if count == 0:
+            self._gate_set = None
+        self._gate_info[op.gate] = count + 1
+        self._num_params += op.num_params
+        self._num_operations += 1
+        self._num_op_qudits += op.num_qudits
+
+        # Update the per-qudit depths, if they are being tracked
+        if self._qudit_depths is not None:
+            location = list(op.location)
+            new_depth = self._qudit_depths[location].max() + 1
+            self._qudit_depths[location] = new_depth
 
         return cycle_index
 
@@ -1333,12 +1365,18 @@ class Circuit(DifferentiableUnitary, StateVectorMap, Collection[Operation]):
         for pair in op.location.pairs:
             if pair not in self._graph_info:
                 self._graph_info[pair] = 0
+                self._coupling_graph = None
             self._graph_info[pair] += 1
 
         # Update _gate_info
-        if op.gate not in self._gate_info:
-            self._gate_info[op.gate] = 0
-        self._gate_info[op.gate] += 1
+        count = self._gate_info.get(op.gate, 0)
+        if count == 0:
+            self._gate_set = None
+        self._gate_info[op.gate] = count + 1
+        self._num_params += op.num_params
+        self._num_operations += 1
+        self._num_op_qudits += op.num_qudits
+        self._qudit_depths = None
 
     def insert_gate(
         self,
@@ -1601,14 +1639,22 @@ class Circuit(DifferentiableUnitary, StateVectorMap, Collection[Operation]):
             self.pop_cycle(point.cycle)
 
         # Update gate and graph counts
-        self._gate_info[op.gate] -= 1
-        if self._gate_info[op.gate] <= 0:
+        count = self._gate_info[op.gate] - 1
+        if count <= 0:
             self._gate_info.pop(op.gate)
+            self._gate_set = None
+        else:
+            self._gate_info[op.gate] = count
+        self._num_params -= op.num_params
+        self._num_operations -= 1
+        self._num_op_qudits -= op.num_qudits
+        self._qudit_depths = None
 
         for pair in op.location.pairs:
             self._graph_info[pair] -= 1
             if self._graph_info[pair] <= 0:
                 self._graph_info.pop(pair)
+                self._coupling_graph = None
 
         return op
 
@@ -1696,13 +1742,17 @@ class Circuit(DifferentiableUnitary, StateVectorMap, Collection[Operation]):
                 self._dag[new_point] = self._dag[old_point]
                 self._dag.pop(old_point)
 
-            self._gate_info[old_op.gate] -= 1
-            if self._gate_info[old_op.gate] <= 0:
+            count = self._gate_info[old_op.gate] - 1
+            if count <= 0:
                 self._gate_info.pop(old_op.gate)
-
-            if op.gate not in self._gate_info:
-                self._gate_info[op.gate] = 0
-            self._gate_info[op.gate] += 1
+                self._gate_set = None
+            else:
+                self._gate_info[old_op.gate] = count
+            count = self._gate_info.get(op.gate, 0)
+            if count == 0:
+                self._gate_set = None
+            self._gate_info[op.gate] = count + 1
+            self._num_params += op.num_params - old_op.num_params
 
             for q in old_op.location:
                 self._circuit[point[0]][q] = op
@@ -1787,6 +1837,12 @@ class Circuit(DifferentiableUnitary, StateVectorMap, Collection[Operation]):
         circuit._circuit = copy.deepcopy(self._circuit)
         circuit._gate_info = copy.deepcopy(self._gate_info)
         circuit._graph_info = copy.deepcopy(self._graph_info)
+        circuit._coupling_graph = self._coupling_graph
+        circuit._num_params = self._num_params
+        circuit._num_operations = self._num_operations
+        circuit._num_op_qudits = self._num_op_qudits
+        if self._qudit_depths is not None:
+            circuit._qudit_depths = self._qudit_depths.copy()
         circuit._front = copy.deepcopy(self._front)
         circuit._rear = copy.deepcopy(self._rear)
         circuit._dag = copy.deepcopy(self._dag)
@@ -1797,18 +1853,38 @@ class Circuit(DifferentiableUnitary, StateVectorMap, Collection[Operation]):
         if deepcopy:
             self._num_qudits = circuit.num_qudits
             self._radixes = circuit.radixes
+            self._dim = circuit.dim
             self._circuit = copy.deepcopy(circuit._circuit)
             self._gate_info = copy.deepcopy(circuit._gate_info)
             self._graph_info = copy.deepcopy(circuit._graph_info)
+            self._coupling_graph = circuit._coupling_graph
+            self._gate_set = None
+            self._num_params = circuit._num_params
+            self._num_operations = circuit._num_operations
+            self._num_op_qudits = circuit._num_op_qudits
+            if circuit._qudit_depths is not None:
+                self._qudit_depths = circuit._qudit_depths.copy()
+            else:
+                self._qudit_depths = None
             self._front = copy.deepcopy(circuit._front)
             self._rear = copy.deepcopy(circuit._rear)
             self._dag = copy.deepcopy(circuit._dag)
         else:
             self._num_qudits = circuit.num_qudits
             self._radixes = circuit.radixes
+            self._dim = circuit.dim
             self._circuit = copy.copy(circuit._circuit)
             self._gate_info = copy.copy(circuit._gate_info)
             self._graph_info = copy.copy(circuit._graph_info)
+            self._coupling_graph = circuit._coupling_graph
+            self._gate_set = None
+            self._num_params = circuit._num_params
+            self._num_operations = circuit._num_operations
+            self._num_op_qudits = circuit._num_op_qudits
+            if circuit._qudit_depths is not None:
+                self._qudit_depths = circuit._qudit_depths.copy()
+            else:
+                self._qudit_depths = None
             self._front = copy.copy(circuit._front)
             self._rear = copy.copy(circuit._rear)
             self._dag = copy.copy(circuit._dag)
@@ -1818,6 +1894,12 @@ class Circuit(DifferentiableUnitary, StateVectorMap, Collection[Operation]):
         self._circuit = []
         self._gate_info = {}
         self._graph_info = {}
+        self._coupling_graph = None
+        self._gate_set = None
+        self._num_params = 0
+        self._num_operations = 0
+        self._num_op_qudits = 0
+        self._qudit_depths = None
         self._front = {i: None for i in range(self.num_qudits)}
         self._rear = {i: None for i in range(self.num_qudits)}
         self._dag = {}
@@ -2503,12 +2585,54 @@ class Circuit(DifferentiableUnitary, StateVectorMap, Collection[Operation]):
 
     def freeze_param(self, param_index: int) -> None:
         """Freeze a circuit parameter to its current value."""
-        cycle, qudit, param = self.get_param_location(param_index)
-        op = self[cycle, qudit]
-        gate = op.gate.with_frozen_params({param: op.params[param]})
-        params = op.params.copy()
-        params.pop(param)
-        self.replace_gate((cycle, qudit), gate, op.location, params)
+        self.freeze_params([param_index])
+
+    def freeze_params(self, param_indices: Iterable[int]) -> None:
+        """
+        Freeze many circuit parameters to their current values at once.
+
+        Args:
+            param_indices (Iterable[int]): The parameters to freeze. These
+                index the circuit's parameters before any are frozen.
+
+        Raises:
+            IndexError: If any of the `param_indices` are invalid.
+        """
+        indices = sorted(set(param_indices))
+        if len(indices) == 0:
+            return
+
+        if indices[0] < 0:
+            raise IndexError('Negative parameter index is not supported.')
+
+        if indices[-1] >= self.num_params:
+            raise IndexError('Out-of-range parameter index.')
+
+        # Group the indices by operation in one pass over the circuit
+        to_freeze: list[tuple[CircuitPoint, Operation, list[int]]] = []
+        count = 0
+        i = 0
+        for cycle, op in self.operations_with_cycles():
+            if i == len(indices):
+                break
+
+            offset = count
+            count += len(op.params)
+            local_indices = []
+            while i < len(indices) and indices[i] < count:
+                local_indices.append(indices[i] - offset)
+                i += 1
+
+            if len(local_indices) > 0:
+                point = CircuitPoint(cycle, op.location[0])
+                to_freeze.append((point, op, local_indices))
+
+        # Same-location replaces never move operations, so points stay valid
+        for point, op, local_indices in to_freeze:
+            frozen = {p: op.params[p] for p in local_indices}
+            gate = op.gate.with_frozen_params(frozen)
+            params = [x for p, x in enumerate(op.params) if p not in frozen]
+            self.replace_gate(point, gate, op.location, params)
 
     def get_param_location(self, param_index: int) -> tuple[int, int, int]:
         """
@@ -2634,7 +2758,11 @@ class Circuit(DifferentiableUnitary, StateVectorMap, Collection[Operation]):
         new_state = StateVector(in_state)
 
         for op in self:
-            if len(params) != 0:
+            # Constant diagonal gates scale amplitudes without a matmul
+            diagonal = op.gate.diagonal
+            if diagonal is not None:
+                new_state.apply_diagonal(diagonal, op.location)
+            elif len(params) != 0:
                 gparams = params[param_index:param_index + op.num_params]
                 new_state.apply(op.get_unitary(gparams), op.location)
                 param_index += op.num_params
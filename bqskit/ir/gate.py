@@ -10,6 +10,9 @@ from typing import Callable
 from typing import ClassVar
 from typing import TYPE_CHECKING
 
+import numpy as np
+import numpy.typing as npt
+
 from bqskit.ir.location import CircuitLocation
 from bqskit.qis.unitary.unitary import Unitary
 
@@ -23,6 +26,7 @@ class Gate(Unitary):
 
     _name: str
     _qasm_name: str
+    _diagonal: ClassVar[npt.NDArray[np.complex128] | None] = None
 
     @property
     def name(self) -> str:
@@ -37,6 +41,18 @@ class Gate(Unitary):
 
         return getattr(self, '_qasm_name')
 
+    @property
+    def diagonal(self) -> npt.NDArray[np.complex128] | None:
+        """
+        The diagonal of this gate's unitary, if it is a fixed diagonal.
+
+        Gates whose unitary is a constant diagonal matrix can set
+        `_diagonal` so simulators scale amplitudes instead of applying
+        the full matrix. This is None for every other gate. The returned
+        array is shared and should not be modified.
+        """
+        return self._diagonal
+
     def get_qasm_gate_def(self) -> str:
         """Returns a qasm gate definition block for this gate."""
         if not self.is_qubit_only():
@@ -1,6 +1,7 @@
 """This module implements the CircuitGate class."""
 from __future__ import annotations
 
+from typing import Any
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -41,6 +42,7 @@ class CircuitGate(Gate):
         self._radixes = self._circuit.radixes
         self._num_params = self._circuit.num_params
         self._name = 'CircuitGate(%s)' % str(self._circuit)
+        self._hash: int | None = None
 
     def get_unitary(self, params: RealVector = []) -> UnitaryMatrix:
         """Return the unitary for this gate, see :class:`Unitary` for more."""
@@ -70,6 +72,10 @@ class CircuitGate(Gate):
         return self._circuit.is_differentiable()
 
     def __hash__(self) -> int:
+        # The wrapped circuit is immutable, so the hash is computed once
+        if self._hash is not None:
+            return self._hash
+
         hashes: list[int] = [hash(self.name)]
         for op in self._circuit:
             hashes.append(hash(op))
@@ -78,8 +84,13 @@ class CircuitGate(Gate):
             if len(hashes) >= 100:
                 hashes = [hash(tuple(hashes))]
 
-        hash_val = hash(tuple(hashes)) if len(hashes) > 1 else hashes[0]
-        return hash_val
+        self._hash = hash(tuple(hashes)) if len(hashes) > 1 else hashes[0]
+        return self._hash
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        # String hashes are salted per process, drop any unpickled hash
+        self._hash = None
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, CircuitGate):
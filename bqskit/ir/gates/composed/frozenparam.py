@@ -44,45 +44,54 @@ class FrozenParameterGate(
                 'Expected dict for frozen_params, '
                 'got %s.' % type(frozen_params),
             )
-        if not len(frozen_params) <= gate.num_params:
+        num_params = gate.num_params
+        if not len(frozen_params) <= num_params:
             raise ValueError(
                 'Too many fixed parameters specified, expected at most'
-                ' %d, got %d' % (gate.num_params, len(frozen_params)),
+                ' %d, got %d' % (num_params, len(frozen_params)),
             )
+        for key, value in frozen_params.items():
+            if not is_integer(key):
+                raise TypeError(
+                    'Expected frozen_params keys to be int, got %s.'
+                    % type(key),
+                )
+            if not is_real_number(value):
+                raise TypeError(
+                    'Expected frozen_params values to be float, got %s.'
+                    % type(value),
+                )
+            if not 0 <= key < num_params:
+                raise ValueError(
+                    'Expected parameter index to be non-negative integer'
+                    ' < %d, got %d.' % (num_params, key),
+                )
         keys = list(frozen_params.keys())
         values = list(frozen_params.values())
-        if not all(is_integer(p) for p in keys):
-            fail_idx = [is_integer(p) for p in keys].index(False)
-            raise TypeError(
-                'Expected frozen_params keys to be int, got %s.'
-                % type(keys[fail_idx]),
-            )
-        if not all(is_real_number(p) for p in values):
-            typechecks = [is_real_number(p) for p in values]
-            fail_idx = typechecks.index(False)
-            raise TypeError(
-                'Expected frozen_params values to be float, got %s.'
-                % type(values[fail_idx]),
-            )
-        if not all(0 <= p < gate.num_params for p in keys):
-            fail_idx = [
-                0 <= p < gate.num_params
-                for p in keys
-            ].index(False)
-            raise ValueError(
-                'Expected parameter index to be non-negative integer'
-                ' < %d, got %d.' % (gate.num_params, keys[fail_idx]),
-            )
 
         self.gate = gate
-        self._num_params = gate.num_params - len(frozen_params)
+        self._num_params = num_params - len(frozen_params)
         self._num_qudits = gate.num_qudits
         self._radixes = gate.radixes
         self.frozen_params = frozen_params
         self.unfixed_param_idxs = [
-            i for i in range(gate.num_params)
+            i for i in range(num_params)
             if i not in self.frozen_params.keys()
         ]
+        self._full_params_template = np.zeros(num_params)
+        self._full_params_template[keys] = values
+
+        # Frozen parameters are usually a prefix or suffix of the gate's
+        # parameters; a slice then selects the rest without copying.
+        idxs = self.unfixed_param_idxs
+        self._unfixed_idx: slice | npt.NDArray[np.intp]
+        if len(idxs) == 0:
+            self._unfixed_idx = slice(0, 0)
+        elif idxs[-1] - idxs[0] + 1 == len(idxs):
+            self._unfixed_idx = slice(idxs[0], idxs[-1] + 1)
+        else:
+            self._unfixed_idx = np.array(idxs, dtype=np.intp)
+
         self._name = '{}({}, {})'.format(
             self.__class__.__name__,
             self.gate.name,
@@ -101,7 +110,7 @@ class FrozenParameterGate(
         See :class:`DifferentiableUnitary` for more info.
         """
         grads = self.gate.get_grad(self.get_full_params(params))  # type: ignore
-        return grads[self.unfixed_param_idxs, :, :]
+        return grads[self._unfixed_idx]
 
     def get_unitary_and_grad(
         self,
@@ -115,7 +124,7 @@ class FrozenParameterGate(
         f_params = self.get_full_params(params)
 
         utry, grads = self.gate.get_unitary_and_grad(f_params)  # type: ignore
-        return utry, grads[self.unfixed_param_idxs, :, :]
+        return utry, grads[self._unfixed_idx]
 
     def optimize(self, env_matrix: npt.NDArray[np.complex128]) -> list[float]:
         """
@@ -124,10 +133,7 @@ class FrozenParameterGate(
         See :class:`LocallyOptimizableUnitary` for more info.
         """
         params = self.gate.optimize(env_matrix)  # type: ignore
-        return [
-            p for i, p in enumerate(params)
-            if i in self.unfixed_param_idxs
-        ]
+        return [params[i] for i in self.unfixed_param_idxs]
 
     def __eq__(self, other: object) -> bool:
         return (
@@ -148,7 +154,7 @@ class FrozenParameterGate(
         """Returns a qasm def for this gate, see :class:Gate for more."""
         return self.gate.get_qasm_gate_def()
 
-    def get_full_params(self, params: RealVector) -> list[float]:
+    def get_full_params(self, params: RealVector) -> npt.NDArray[np.float64]:
         """
         Returns the full parameter list for the underlying gate.
 
@@ -156,12 +162,11 @@ class FrozenParameterGate(
             params (RealVector): The parameters to the gate.
 
         Returns:
-            list[float]: The full parameters to the underlying gate.
+            np.ndarray: The full parameters to the underlying gate.
         """
         self.check_parameters(params)
-        args = list(params)
-        for idx in sorted(self.frozen_params):
-            args.insert(idx, self.frozen_params[idx])
+        args = self._full_params_template.copy()
+        args[self._unfixed_idx] = params
         return args
 
 
@@ -27,6 +27,9 @@ class VariableLocationGate(ComposedGate):
     of all locations.
     """
 
+    # Steepness of the softmax over the location parameters
+    _softmax_beta = 10
+
     def __init__(
         self,
         gate: Gate,
@@ -63,67 +66,65 @@ class VariableLocationGate(ComposedGate):
         if not isinstance(gate, Gate):
             raise TypeError('Expected gate object, got %s' % type(gate))
 
-        if not all(CircuitLocation.is_location(l) for l in locations):
-            raise TypeError('Expected a sequence of valid locations.')
+        if len(locations) < 1:
+            raise ValueError('VLGs require at least 1 locations.')
 
-        locations = [CircuitLocation(l) for l in locations]
+        # Validate locations and collect qudit radixes in a single pass
+        canonical_locations = []
+        radix_map: dict[int, int] = {}
+        for l in locations:
+            if not CircuitLocation.is_location(l):
+                raise TypeError('Expected a sequence of valid locations.')
 
-        if not all(len(l) == gate.num_qudits for l in locations):
-            raise ValueError('Invalid sized location.')
+            l = CircuitLocation(l)
 
-        if len(locations) < 1:
-            raise ValueError('VLGs require at least 1 locations.')
+            if len(l) != gate.num_qudits:
+                raise ValueError('Invalid sized location.')
+
+            for radix, qudit_index in zip(gate.radixes, l):
+                if len(radixes) != 0:
+                    expected_radix = radixes[qudit_index]
+                else:
+                    expected_radix = radix_map.setdefault(qudit_index, radix)
+
+                if expected_radix != radix:
+                    raise ValueError(
+                        'Gate cannot be applied to all locations'
+                        ' due to radix mismatch.',
+                    )
+
+            canonical_locations.append(l)
 
         self.gate = gate
-        name_str_tuple = (gate.name, locations, radixes)
+        name_str_tuple = (gate.name, canonical_locations, radixes)
         self._name = 'VariableLocationGate(%s, %s, %s)' % name_str_tuple
-        self.locations = list(locations)
-        self._num_qudits = len(set(sum((tuple(l) for l in locations), tuple())))
+        self.locations = canonical_locations
 
         if len(radixes) == 0:
-            # Calculate radixes
-            radix_map: dict[int, int | None] = {
-                i: None for i in range(self.num_qudits)
-            }
-            for l in locations:
-                for radix, qudit_index in zip(gate.radixes, l):
-                    if radix_map[qudit_index] is None:
-                        radix_map[qudit_index] = radix
-                    elif radix_map[qudit_index] != radix:
-                        raise ValueError(
-                            'Gate cannot be applied to all locations'
-                            ' due to radix mismatch.',
-                        )
-
-            if None in radix_map.values():
+            if any(i not in radix_map for i in range(len(radix_map))):
                 raise ValueError('VariableUnitaryGate cannot infer radixes.')
 
-            self._radixes = tuple(radix_map.values())  # type: ignore
+            self._radixes = tuple(radix_map[i] for i in range(len(radix_map)))
         else:
-            for l in locations:
-                for radix, qudit_index in zip(gate.radixes, l):
-                    if radixes[qudit_index] != radix:
-                        raise ValueError(
-                            'Gate cannot be applied to all locations'
-                            ' due to radix mismatch.',
-                        )
-
             self._radixes = tuple(radixes)
-            self._num_qudits = len(self.radixes)
+
+        self._num_qudits = len(self.radixes)
 
         self._num_params = self.gate.num_params + len(locations)
 
         self.extension_size = self.num_qudits - self.gate.num_qudits
         # TODO: This needs to changed for radixes
         self.I = np.identity(2 ** self.extension_size)
-        self.perms = np.array([
-            PermutationMatrix.from_qubit_location(self.num_qudits, l)
+        self.perms = np.stack([
+            PermutationMatrix.from_qubit_location(self.num_qudits, l).numpy
             for l in self.locations
         ])
+        self._permsT = np.ascontiguousarray(self.perms.transpose((0, 2, 1)))
 
     def get_location(self, params: RealVector) -> tuple[int, ...]:
         """Returns the gate's location."""
-        idx = int(np.argmax(self.split_params(params)[1]))
+        # softmax is monotonic, so the raw location parameters suffice
+        idx = int(np.argmax(params[self.gate.num_params:]))
         return tuple(self.locations[idx])
 
     def split_params(
@@ -136,16 +137,44 @@ class VariableLocationGate(ComposedGate):
             np.array(params[self.gate.num_params:]),
         )
 
+    def _apply_extended(
+        self,
+        G: npt.NDArray[np.complex128],
+        M: npt.NDArray[np.complex128],
+    ) -> npt.NDArray[np.complex128]:
+        """
+        Return `np.kron(G, self.I) @ M` without forming the Kronecker product.
+
+        `G` and `M` may carry leading batch dimensions, which are
+        broadcast against each other.
+        """
+        D = M.shape[-1]
+        out = np.matmul(G, M.reshape(M.shape[:-2] + (G.shape[-1], -1)))
+        return out.reshape(out.shape[:-2] + (D, D))
+
+    def _closest_unitary(self, M: npt.NDArray[np.complex128]) -> UnitaryMatrix:
+        """
+        Return the unitary closest to `M`, skipping the SVD if possible.
+
+        Once the location parameters have settled on one location, `M`
+        is a permuted unitary already, so the projection is only needed
+        when it is measurably non-unitary.
+        """
+        err = np.linalg.norm(M.conj().T @ M - np.identity(len(M)))
+        if err < 1e-12:
+            return UnitaryMatrix._from_raw(M, self.radixes)
+        return UnitaryMatrix.closest_to(M, self.radixes)
+
     def get_unitary(self, params: RealVector = []) -> UnitaryMatrix:
         """Return the unitary for this gate, see :class:`Unitary` for more."""
         self.check_parameters(params)
         a, l = self.split_params(params)
-        l = softmax(l, 10)
+        l = softmax(l, self._softmax_beta)
 
-        P = np.sum([a * s for a, s in zip(l, self.perms)], 0)
-        G = self.gate.get_unitary(a)
-        PGPT = P.T @ np.kron(G, self.I) @ P
-        return UnitaryMatrix.closest_to(PGPT, self.radixes)
+        P = np.tensordot(l, self.perms, axes=1)
+        G = self.gate.get_unitary(a).numpy
+        PTGP = P.T @ self._apply_extended(G, P)
+        return self._closest_unitary(PTGP)
 
     def get_grad(self, params: RealVector = []) -> npt.NDArray[np.complex128]:
         """
@@ -166,24 +195,100 @@ class VariableLocationGate(ComposedGate):
         """
         self.check_parameters(params)
         a, l = self.split_params(params)
-        l = softmax(l, 10)
-
-        P = np.sum([a * s for a, s in zip(l, self.perms)], 0)
-        G = self.gate.get_unitary(a)
-        G = np.kron(G, self.I)
-        PG = P @ G
-        GPT = G @ P.T
-        PGPT = P @ GPT
-
-        dG = cast(DifferentiableUnitary, self.gate).get_grad(a)
-        dG = np.kron(dG, self.I)
-        dG = P @ dG @ P.T
-
-        perm_array = np.array([perm for perm in self.perms])
-        dP = perm_array @ GPT + PG @ perm_array.transpose((0, 2, 1)) - 2 * PGPT
-        dP = np.array([10 * x * y for x, y in zip(l, dP)])
-        U = UnitaryMatrix.closest_to(PGPT, self.radixes)
-        return U, np.concatenate([dG, dP])
+        l = softmax(l, self._softmax_beta)
+
+        P = np.tensordot(l, self.perms, axes=1)
+        G = self.gate.get_unitary(a).numpy
+        GP = self._apply_extended(G, P)
+        PTG = self._apply_extended(G.T, P).T
+        PTGP = P.T @ GP
+
+        grad = np.empty((self.num_params,) + P.shape, dtype=np.complex128)
+        dG = grad[:self.gate.num_params]
+        dP = grad[self.gate.num_params:]
+
+        subgrad = cast(DifferentiableUnitary, self.gate).get_grad(a)
+        subgrad = subgrad.reshape((self.gate.num_params,) + G.shape)
+        np.matmul(P.T, self._apply_extended(subgrad, P), out=dG)
+
+        # Accumulate dP in place inside the gradient array
+        np.matmul(self._permsT, GP, out=dP)
+        dP += PTG @ self.perms
+        dP -= 2 * PTGP
+        dP *= (self._softmax_beta * l)[:, None, None]
+        U = self._closest_unitary(PTGP)
+        return U, grad
+
+    def _split_params_batch(
+        self,
+        params_batch: npt.NDArray[np.float64],
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Split rows into subgate params and softmaxed location weights."""
+        params_batch = np.asarray(params_batch, dtype=np.float64)
+        self.check_parameters_batch(params_batch)
+        A = params_batch[:, :self.gate.num_params]
+        L = params_batch[:, self.gate.num_params:]
+        return A, softmax(L, self._softmax_beta, axis=1)
+
+    def get_unitary_batch(
+        self,
+        params_batch: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.complex128]:
+        """
+        Return the unitary for each row of `params_batch`.
+
+        See :class:`Unitary` for more info.
+        """
+        A, L = self._split_params_batch(params_batch)
+        P = np.tensordot(L, self.perms, axes=1)
+        G = self.gate.get_unitary_batch(A)
+        PTGP = P.transpose((0, 2, 1)) @ self._apply_extended(G, P)
+        V, _, Wh = np.linalg.svd(PTGP)
+        return V @ Wh
+
+    def get_grad_batch(
+        self,
+        params_batch: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.complex128]:
+        """
+        Return the gradient for each row of `params_batch`.
+
+        See :class:`DifferentiableUnitary` for more info.
+        """
+        return self.get_unitary_and_grad_batch(params_batch)[1]
+
+    def get_unitary_and_grad_batch(
+        self,
+        params_batch: npt.NDArray[np.float64],
+    ) -> tuple[npt.NDArray[np.complex128], npt.NDArray[np.complex128]]:
+        """
+        Return the unitary and gradient for each row of `params_batch`.
+
+        This evaluates the whole batch with broadcast matrix products
+        instead of looping over :func:`get_unitary_and_grad`.
+
+        See :class:`DifferentiableUnitary` for more info.
+        """
+        A, L = self._split_params_batch(params_batch)
+        gate = cast(DifferentiableUnitary, self.gate)
+
+        P = np.tensordot(L, self.perms, axes=1)
+        PT = P.transpose((0, 2, 1))
+        G = gate.get_unitary_batch(A)
+        GP = self._apply_extended(G, P)
+        PTG = self._apply_extended(G.transpose((0, 2, 1)), P)
+        PTG = PTG.transpose((0, 2, 1))
+        PTGP = PT @ GP
+
+        dG = gate.get_grad_batch(A)
+        dG = PT[:, None] @ self._apply_extended(dG, P[:, None])
+
+        dP = self._permsT @ GP[:, None] + PTG[:, None] @ self.perms
+        dP -= 2 * PTGP[:, None]
+        dP *= self._softmax_beta * L[:, :, None, None]
+
+        V, _, Wh = np.linalg.svd(PTGP)
+        return V @ Wh, np.concatenate([dG, dP], axis=1)
 
     def optimize(self, env_matrix: npt.NDArray[np.complex128]) -> list[float]:
         """
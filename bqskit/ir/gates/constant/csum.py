@@ -65,15 +65,11 @@ class CSUMGate(ConstantGate, QuditGate):
 
         self._radix = radix
 
-        ival = 0
-        jval = 0
-        matrix = np.zeros([self.radix**2, self.radix**2])
-        for i, col in enumerate(matrix.T):
-            col[self.radix * jval + ((ival + jval) % self.radix)] = 1
-            matrix[:, i] = col
-            if ival == self.radix - 1:
-                ival = 0
-                jval += 1
-            else:
-                ival += 1
-        self._utry = UnitaryMatrix(matrix, self.radixes)
+        # Column j * radix + i maps to row j * radix + (i + j) % radix
+        dim = self.radix ** 2
+        cols = np.arange(dim)
+        jvals, ivals = np.divmod(cols, self.radix)
+        rows = self.radix * jvals + (ivals + jvals) % self.radix
+        matrix = np.zeros((dim, dim), dtype=np.complex128)
+        matrix[rows, cols] = 1
+        self._utry = UnitaryMatrix(matrix, self.radixes, False)
@@ -1,6 +1,8 @@
 """This module implements the CZGate."""
 from __future__ import annotations
 
+import numpy as np
+
 from bqskit.ir.gates.constantgate import ConstantGate
 from bqskit.ir.gates.qubitgate import QubitGate
 from bqskit.qis.unitary.unitarymatrix import UnitaryMatrix
@@ -32,3 +34,4 @@ class CZGate(ConstantGate, QubitGate):
             [0, 0, 0, -1],
         ],
     )
+    _diagonal = np.array([1, 1, 1, -1], dtype=np.complex128)
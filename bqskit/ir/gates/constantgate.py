@@ -1,6 +1,8 @@
 """This module implements the ConstantGate base class."""
 from __future__ import annotations
 
+from typing import Any
+
 import numpy as np
 import numpy.typing as npt
 
@@ -23,10 +25,21 @@ class ConstantGate(
     _num_params = 0
     _utry: UnitaryMatrix
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Mark class-level matrices read-only so they can be shared."""
+        super().__init_subclass__(**kwargs)
+        utry = cls.__dict__.get('_utry', None)
+        if isinstance(utry, UnitaryMatrix):
+            utry.numpy.flags.writeable = False
+        diagonal = cls.__dict__.get('_diagonal', None)
+        if isinstance(diagonal, np.ndarray):
+            diagonal.flags.writeable = False
+
     def get_unitary(self, params: RealVector = []) -> UnitaryMatrix:
         """Return the unitary for this gate, see :class:`Unitary` for more."""
-        self.check_parameters(params)
-        return getattr(self, '_utry')
+        if len(params) != 0:
+            self.check_parameters(params)
+        return self._utry
 
     def get_grad(self, params: RealVector = []) -> npt.NDArray[np.complex128]:
         """
@@ -46,8 +59,9 @@ class ConstantGate(
 
         See :class:`DifferentiableUnitary` for more info.
         """
-        self.check_parameters(params)
-        return getattr(self, '_utry'), np.array([])
+        if len(params) != 0:
+            self.check_parameters(params)
+        return self._utry, np.array([])
 
     def optimize(self, env_matrix: npt.NDArray[np.complex128]) -> list[float]:
         """
@@ -1,6 +1,9 @@
 """This module implements the U2Gate."""
 from __future__ import annotations
 
+import cmath
+import math
+
 import numpy as np
 import numpy.typing as npt
 
@@ -10,6 +13,8 @@ from bqskit.qis.unitary.unitary import RealVector
 from bqskit.qis.unitary.unitarymatrix import UnitaryMatrix
 from bqskit.utils.cachedclass import CachedClass
 
+_SQ2 = math.sqrt(2) / 2
+
 
 class U2Gate(QubitGate, DifferentiableUnitary, CachedClass):
     """
@@ -33,17 +38,15 @@ class U2Gate(QubitGate, DifferentiableUnitary, CachedClass):
     def get_unitary(self, params: RealVector = []) -> UnitaryMatrix:
         """Return the unitary for this gate, see :class:`Unitary` for more."""
         self.check_parameters(params)
+        eip = cmath.exp(1j * params[0])
+        eil = cmath.exp(1j * params[1])
 
-        sq2 = np.sqrt(2) / 2
-        eip = np.exp(1j * params[0])
-        eil = np.exp(1j * params[1])
-
-        return UnitaryMatrix(
-            [
-                [sq2, -eil * sq2],
-                [eip * sq2, eip * eil * sq2],
-            ],
-        )
+        utry = np.empty((2, 2), dtype=np.complex128)
+        utry[0, 0] = _SQ2
+        utry[0, 1] = -eil * _SQ2
+        utry[1, 0] = eip * _SQ2
+        utry[1, 1] = eip * eil * _SQ2
+        return UnitaryMatrix._from_raw(utry, self.radixes)
 
     def get_grad(self, params: RealVector = []) -> npt.NDArray[np.complex128]:
         """
@@ -52,23 +55,76 @@ class U2Gate(QubitGate, DifferentiableUnitary, CachedClass):
         See :class:`DifferentiableUnitary` for more info.
         """
         self.check_parameters(params)
+        eip = cmath.exp(1j * params[0])
+        eil = cmath.exp(1j * params[1])
+
+        # params[0] only phases the bottom row and params[1] only
+        # phases the right column, so both derivatives are 1j * U there.
+        grad = np.zeros((2, 2, 2), dtype=np.complex128)
+        grad[0, 1, 0] = 1j * eip * _SQ2
+        grad[0, 1, 1] = grad[1, 1, 1] = 1j * eip * eil * _SQ2
+        grad[1, 0, 1] = -1j * eil * _SQ2
+        return grad
+
+    def get_unitary_and_grad(
+        self,
+        params: RealVector = [],
+    ) -> tuple[UnitaryMatrix, npt.NDArray[np.complex128]]:
+        """
+        Return the unitary and gradient for this gate.
+
+        See :class:`DifferentiableUnitary` for more info.
+        """
+        self.check_parameters(params)
+        eip = cmath.exp(1j * params[0])
+        eil = cmath.exp(1j * params[1])
+
+        utry = np.empty((2, 2), dtype=np.complex128)
+        utry[0, 0] = _SQ2
+        utry[0, 1] = -eil * _SQ2
+        utry[1, 0] = eip * _SQ2
+        utry[1, 1] = eip * eil * _SQ2
+
+        # params[0] only phases the bottom row and params[1] only
+        # phases the right column, so both derivatives are 1j * U there.
+        grad = np.zeros((2, 2, 2), dtype=np.complex128)
+        grad[0, 1, :] = 1j * utry[1, :]
+        grad[1, :, 1] = 1j * utry[:, 1]
+        return UnitaryMatrix._from_raw(utry, self.radixes), grad
+
+    def get_unitary_batch(
+        self,
+        params_batch: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.complex128]:
+        """
+        Return the unitary for each row of `params_batch`.
 
-        sq2 = np.sqrt(2) / 2
-        eip = np.exp(1j * params[0])
-        eil = np.exp(1j * params[1])
-        deip = 1j * np.exp(1j * params[0])
-        deil = 1j * np.exp(1j * params[1])
-
-        return np.array(
-            [
-                [  # wrt params[0]
-                    [0, 0],
-                    [deip * sq2, deip * eil * sq2],
-                ],
-
-                [  # wrt params[1]
-                    [0, -deil * sq2],
-                    [0, eip * deil * sq2],
-                ],
-            ], dtype=np.complex128,
-        )
+        See :class:`Unitary` for more info.
+        """
+        params_batch = np.asarray(params_batch, dtype=np.float64)
+        self.check_parameters_batch(params_batch)
+
+        eip = np.exp(1j * params_batch[:, 0])
+        eil = np.exp(1j * params_batch[:, 1])
+
+        out = np.empty((len(params_batch), 2, 2), dtype=np.complex128)
+        out[:, 0, 0] = _SQ2
+        out[:, 0, 1] = -eil * _SQ2
+        out[:, 1, 0] = eip * _SQ2
+        out[:, 1, 1] = eip * eil * _SQ2
+        return out
+
+    def get_grad_batch(
+        self,
+        params_batch: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.complex128]:
+        """
+        Return the gradient for each row of `params_batch`.
+
+        See :class:`DifferentiableUnitary` for more info.
+        """
+        U = self.get_unitary_batch(params_batch)
+        out = np.zeros((len(U), 2, 2, 2), dtype=np.complex128)
+        out[:, 0, 1, :] = 1j * U[:, 1, :]
+        out[:, 1, :, 1] = 1j * U[:, :, 1]
+        return out
@@ -1,6 +1,8 @@
 """This module implements the CircuitLocation class."""
 from __future__ import annotations
 
+import functools
+import itertools as it
 import logging
 from typing import Any
 from typing import Iterator
@@ -39,6 +41,10 @@ class CircuitLocation(Sequence[int]):
             ValueError: If there are duplicates in location.
         """
 
+        if isinstance(location, CircuitLocation):
+            self._location: tuple[int, ...] = location._location
+            return
+
         if is_integer(location):
             location = [location]
 
@@ -67,7 +73,7 @@ class CircuitLocation(Sequence[int]):
         if len(set(location)) != len(location):
             raise ValueError('Location has duplicate qudit indices.')
 
-        self._location: tuple[int, ...] = tuple(location)
+        self._location = tuple(location)
 
     @overload
     def __getitem__(self, index: int) -> int:
@@ -111,18 +117,10 @@ class CircuitLocation(Sequence[int]):
             return CircuitLocation([other] if other in self else [])
         return CircuitLocation([x for x in self if x in other])  # type: ignore
 
-    @property
-    def pairs(self) -> set[tuple[int, int]]:
+    @functools.cached_property
+    def pairs(self) -> frozenset[tuple[int, int]]:
         """Return all pairs of unique elements in the location."""
-        _pairs = set()
-        for q1 in self:
-            for q2 in self:
-                if q1 == q2:
-                    continue
-                a = min(q1, q2)
-                b = max(q1, q2)
-                _pairs.add((a, b))
-        return _pairs
+        return frozenset(it.combinations(sorted(self._location), 2))
 
     @staticmethod
     def is_location(
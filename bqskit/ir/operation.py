@@ -19,6 +19,15 @@ from bqskit.utils.typing import is_sequence
 class Operation(DifferentiableUnitary):
     """An Operation groups together a gate, its parameters and location."""
 
+    __slots__ = (
+        '_num_params',
+        '_radixes',
+        '_num_qudits',
+        '_gate',
+        '_location',
+        '_params',
+    )
+
     def __init__(
         self,
         gate: Gate,
@@ -38,14 +38,16 @@ class CouplingGraph(Collection[Tuple[int, int]]):
     ) -> None:
         if isinstance(graph, CouplingGraph):
             self.num_qudits: int = graph.num_qudits
-            self._edges: set[tuple[int, int]] = graph._edges
+            self._edges: frozenset[tuple[int, int]] = graph._edges
             self._adj: list[set[int]] = graph._adj
             return
 
         if not CouplingGraph.is_valid_coupling_graph(graph):
             raise TypeError('Invalid coupling graph.')
 
-        self._edges = {g if g[0] <= g[1] else (g[1], g[0]) for g in graph}
+        self._edges = frozenset(
+            g if g[0] <= g[1] else (g[1], g[0]) for g in graph
+        )
 
         calced_num_qudits = 0
         for q1, q2 in self._edges:
@@ -115,16 +117,16 @@ class CouplingGraph(Collection[Tuple[int, int]]):
         return self._edges.__iter__()
 
     def __hash__(self) -> int:
-        return hash((self.num_qudits, tuple(self._edges)))
+        return hash((self.num_qudits, self._edges))
 
     def __len__(self) -> int:
         return self._edges.__len__()
 
     def __str__(self) -> str:
-        return 'CouplingGraph(' + self._edges.__str__() + ')'
+        return 'CouplingGraph(' + set(self._edges).__str__() + ')'
 
     def __repr__(self) -> str:
-        return self._edges.__repr__()
+        return set(self._edges).__repr__()
 
     def get_qudit_degrees(self) -> list[int]:
         return [len(l) for l in self._adj]
@@ -305,36 +307,32 @@ class CouplingGraph(Collection[Tuple[int, int]]):
             _logger.debug('Coupling graph is not iterable.')
             return False
 
-        if len(list(coupling_graph)) == 0:
+        pairs = list(coupling_graph)
+        if len(pairs) == 0:
             return True
 
-        if not all(isinstance(pair, tuple) for pair in coupling_graph):
-            _logger.debug('Coupling graph is not a sequence of tuples.')
-            return False
-
-        if not all([len(pair) == 2 for pair in coupling_graph]):
-            _logger.debug('Coupling graph is not a sequence of pairs.')
-            return False
-
         if num_qudits is not None:
             if not (is_integer(num_qudits) and num_qudits > 0):
                 _logger.debug('Invalid num_qudits in coupling graph check.')
                 return False
 
-            if not all(
-                qudit < num_qudits
-                for pair in coupling_graph
-                for qudit in pair
-            ):
-                _logger.debug('Coupling graph has invalid qudits.')
+        for pair in pairs:
+            if not isinstance(pair, tuple):
+                _logger.debug('Coupling graph is not a sequence of tuples.')
                 return False
 
-        if not all([
-            len(pair) == len(set(pair))
-            for pair in coupling_graph
-        ]):
-            _logger.debug('Coupling graph has an invalid pair.')
-            return False
+            if len(pair) != 2:
+                _logger.debug('Coupling graph is not a sequence of pairs.')
+                return False
+
+            if num_qudits is not None:
+                if not (pair[0] < num_qudits and pair[1] < num_qudits):
+                    _logger.debug('Coupling graph has invalid qudits.')
+                    return False
+
+            if pair[0] == pair[1]:
+                _logger.debug('Coupling graph has an invalid pair.')
+                return False
 
         return True
 
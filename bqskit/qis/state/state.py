@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import math
 from typing import Any
 from typing import cast
 from typing import Iterator
@@ -79,12 +80,11 @@ class StateVector(NDArrayOperatorsMixin):
 
         # Check if unitary dimension is a power of two
         elif dim & (dim - 1) == 0:
-            self._radixes = tuple([2] * int(np.round(np.log2(dim))))
+            self._radixes = (2,) * (dim.bit_length() - 1)
 
         # Check if unitary dimension is a power of three
-        elif 3 ** int(np.round(np.log(dim) / np.log(3))) == dim:  # noqa
-            radixes = [3] * int(np.round(np.log(dim) / np.log(3)))
-            self._radixes = tuple(radixes)
+        elif 3 ** round(math.log(dim, 3)) == dim:
+            self._radixes = (3,) * round(math.log(dim, 3))
 
         else:
             raise RuntimeError(
@@ -145,9 +145,9 @@ class StateVector(NDArrayOperatorsMixin):
         """Implements NumPy API for the StateVector class."""
         return self._vec[index]
 
-    def get_probs(self) -> tuple[float, ...]:
+    def get_probs(self) -> npt.NDArray[np.float64]:
         """Return the probabilities for each classical outcome."""
-        return tuple(np.abs(elem)**2 for elem in self)
+        return self._vec.real ** 2 + self._vec.imag ** 2
 
     def is_qubit_only(self) -> bool:
         """Return true if this unitary can only act on qubits."""
@@ -187,7 +187,9 @@ class StateVector(NDArrayOperatorsMixin):
         if isinstance(V, StateSystem):
             return False
 
-        if not np.allclose(np.sum(np.square(np.abs(V))), 1, rtol=0, atol=tol):
+        V = np.asarray(V)
+        norm = np.vdot(V, V).real
+        if not abs(norm - 1) <= tol:
             _logger.debug('Failed pure state criteria.')
             return False
 
@@ -351,6 +353,48 @@ class StateVector(NDArrayOperatorsMixin):
         self._vec = self._vec.transpose(inv_perm)
         self._vec = self._vec.reshape(-1)
 
+    def apply_diagonal(
+        self,
+        diag: npt.NDArray[np.complex128],
+        location: CircuitLocationLike,
+    ) -> None:
+        """
+        Apply a diagonal unitary, given by its diagonal, to this state.
+
+        This is equivalent to :func:`apply` with `np.diag(diag)`, but
+        scales the amplitudes in place of a dense matrix product.
+
+        Args:
+            diag (np.ndarray): The diagonal entries of the unitary.
+
+            location (CircuitLocationLike): The qudits to apply the
+                unitary on.
+
+        Raises:
+            ValueError: If `diag`'s length does not match the dimension
+                of the given location.
+        """
+        from bqskit.ir.location import CircuitLocation
+
+        if not CircuitLocation.is_location(location, self.num_qudits):
+            raise TypeError('Invalid location.')
+
+        location = CircuitLocation(location)
+        loc_radixes = [self.radixes[q] for q in location]
+
+        if len(diag) != int(np.prod(loc_radixes)):
+            raise ValueError('Diagonal and location size mismatch.')
+
+        # Broadcast the diagonal over the qudit axes it acts on
+        shape = [1] * self.num_qudits
+        for q in location:
+            shape[q] = self.radixes[q]
+        order = np.argsort(location)
+        factors = np.reshape(diag, loc_radixes).transpose(order)
+        factors = factors.reshape(shape)
+
+        self._vec = (self._vec.reshape(self.radixes) * factors).reshape(-1)
+
     def get_distance_from(self, other: StateLike) -> float:
         """
         Return the distance between `self` and `other`.
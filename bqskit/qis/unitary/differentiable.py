@@ -20,6 +20,8 @@ class DifferentiableUnitary(Unitary):
     :func:`get_unitary_and_grad` method.
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def get_grad(self, params: RealVector = []) -> npt.NDArray[np.complex128]:
         """
@@ -65,3 +67,63 @@ class DifferentiableUnitary(Unitary):
             calculating both at the same time.
         """
         return (self.get_unitary(params), self.get_grad(params))
+
+    def get_grad_batch(
+        self,
+        params_batch: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.complex128]:
+        """
+        Return the gradient for each row of `params_batch`.
+
+        Args:
+            params_batch (np.ndarray): A `(N, num_params)`-shaped array
+                where each row is a parameter vector, see
+                :func:`Unitary.get_unitary` for more info.
+
+        Returns:
+            np.ndarray: The `(N, num_params, dim, dim)`-shaped array of
+            gradients, where the i-th element is the gradient for the
+            i-th row, see :func:`get_grad`.
+
+        Notes:
+            The default implementation calls :func:`get_grad` once per
+            row. It can be overridden to evaluate the whole batch at once.
+        """
+        params_batch = np.asarray(params_batch, dtype=np.float64)
+        self.check_parameters_batch(params_batch)
+        shape = (len(params_batch), self.num_params, self.dim, self.dim)
+        out = np.empty(shape, np.complex128)
+        if self.num_params == 0:
+            return out
+        for i, params in enumerate(params_batch):
+            out[i] = self.get_grad(params)
+        return out
+
+    def get_unitary_and_grad_batch(
+        self,
+        params_batch: npt.NDArray[np.float64],
+    ) -> tuple[npt.NDArray[np.complex128], npt.NDArray[np.complex128]]:
+        """
+        Return a tuple combining `get_unitary_batch` and `get_grad_batch`.
+
+        Args:
+            params_batch (np.ndarray): A `(N, num_params)`-shaped array
+                where each row is a parameter vector, see
+                :func:`Unitary.get_unitary` for more info.
+
+        Returns:
+            tuple: tuple containing:
+                np.ndarray: The `(N, dim, dim)`-shaped unitaries, see
+                :func:`Unitary.get_unitary_batch` for more info.
+
+                np.ndarray: The `(N, num_params, dim, dim)`-shaped
+                gradients, see :func:`get_grad_batch`.
+
+        Notes:
+            Can be overridden to potentially speed up optimization by
+            calculating both at the same time.
+        """
+        return (
+            self.get_unitary_batch(params_batch),
+            self.get_grad_batch(params_batch),
+        )
@@ -2,11 +2,13 @@
 from __future__ import annotations
 
 import abc
+import math
 from typing import Sequence
 from typing import TYPE_CHECKING
 from typing import Union
 
 import numpy as np
+import numpy.typing as npt
 
 from bqskit.qis.unitary.meta import UnitaryMeta
 from bqskit.utils.typing import is_real_number
@@ -24,6 +26,8 @@ class Unitary(metaclass=UnitaryMeta):
     This is captured in the `get_unitary` abstract method.
     """
 
+    __slots__ = ()
+
     _num_params: int
     _num_qudits: int
     _radixes: tuple[int, ...]
@@ -53,7 +57,7 @@ class Unitary(metaclass=UnitaryMeta):
         if hasattr(self, '_dim'):
             return self._dim
 
-        return int(np.prod(self.radixes))
+        return int(math.prod(self.radixes))
 
     @abc.abstractmethod
     def get_unitary(self, params: RealVector = []) -> UnitaryMatrix:
@@ -70,11 +74,11 @@ class Unitary(metaclass=UnitaryMeta):
 
     def is_qubit_only(self) -> bool:
         """Return true if this unitary can only act on qubits."""
-        return all([radix == 2 for radix in self.radixes])
+        return self.radixes.count(2) == len(self.radixes)
 
     def is_qutrit_only(self) -> bool:
         """Return true if this unitary can only act on qutrits."""
-        return all([radix == 3 for radix in self.radixes])
+        return self.radixes.count(3) == len(self.radixes)
 
     def is_qudit_only(self, radix: int) -> bool:
         """
@@ -84,7 +88,7 @@ class Unitary(metaclass=UnitaryMeta):
             radix (int): Check all qudits have this many orthogonal
                 states.
         """
-        return all([r == radix for r in self.radixes])
+        return self.radixes.count(radix) == len(self.radixes)
 
     def is_parameterized(self) -> bool:
         """Return true if this unitary is parameterized."""
@@ -124,6 +128,66 @@ class Unitary(metaclass=UnitaryMeta):
                 % (self.num_params, len(params)),
             )
 
+    def check_parameters_batch(
+        self,
+        params_batch: npt.NDArray[np.float64],
+    ) -> None:
+        """
+        Check a batch of parameter vectors is valid and matches the unitary.
+
+        Args:
+            params_batch (np.ndarray): The `(N, num_params)`-shaped
+                array of parameter vectors to check.
+
+        Raises:
+            ValueError: If `params_batch` is not two-dimensional or its
+                rows do not match the expected number of parameters.
+        """
+        if not isinstance(params_batch, np.ndarray):
+            raise TypeError(
+                'Expected np.ndarray for params_batch, got %s.'
+                % type(params_batch),
+            )
+
+        if params_batch.ndim != 2:
+            raise ValueError(
+                'Expected two-dimensional params_batch, got %d dimensions.'
+                % params_batch.ndim,
+            )
+
+        if params_batch.shape[1] != self.num_params:
+            raise ValueError(
+                'Expected %d params per row, got %d.'
+                % (self.num_params, params_batch.shape[1]),
+            )
+
+    def get_unitary_batch(
+        self,
+        params_batch: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.complex128]:
+        """
+        Map each row of `params_batch` to its unitary matrix.
+
+        Args:
+            params_batch (np.ndarray): A `(N, num_params)`-shaped array
+                where each row is a parameter vector, see
+                :func:`get_unitary` for more info.
+
+        Returns:
+            np.ndarray: The `(N, dim, dim)`-shaped array of unitaries,
+            where the i-th element is the unitary for the i-th row.
+
+        Notes:
+            The default implementation calls :func:`get_unitary` once per
+            row. It can be overridden to evaluate the whole batch at once.
+        """
+        params_batch = np.asarray(params_batch, dtype=np.float64)
+        self.check_parameters_batch(params_batch)
+        out = np.empty((len(params_batch), self.dim, self.dim), np.complex128)
+        for i, params in enumerate(params_batch):
+            out[i] = self.get_unitary(params).numpy
+        return out
+
     def is_self_inverse(self, params: RealVector = []) -> bool:
         """
         Checks whether the unitary is its own inverse.
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import math
 from typing import Any
 from typing import Sequence
 from typing import TYPE_CHECKING
@@ -103,12 +104,11 @@ class UnitaryMatrix(Unitary, StateVectorMap, NDArrayOperatorsMixin):
 
         # Check if unitary dimension is a power of two
         elif dim & (dim - 1) == 0:
-            self._radixes = tuple([2] * int(np.round(np.log2(dim))))
+            self._radixes = (2,) * (dim.bit_length() - 1)
 
         # Check if unitary dimension is a power of three
-        elif 3 ** int(np.round(np.log(dim) / np.log(3))) == dim:  # noqa
-            radixes = [3] * int(np.round(np.log(dim) / np.log(3)))
-            self._radixes = tuple(radixes)
+        elif 3 ** round(math.log(dim, 3)) == dim:
+            self._radixes = (3,) * round(math.log(dim, 3))
 
         else:
             raise RuntimeError(
@@ -127,6 +127,35 @@ class UnitaryMatrix(Unitary, StateVectorMap, NDArrayOperatorsMixin):
 
     _num_params = 0
 
+    @classmethod
+    def _from_raw(
+        cls,
+        utry: npt.NDArray[np.complex128],
+        radixes: tuple[int, ...],
+    ) -> UnitaryMatrix:
+        """
+        Wrap `utry` in a UnitaryMatrix without copying or validating it.
+
+        Args:
+            utry (np.ndarray): A square complex128 unitary matrix.
+
+            radixes (tuple[int, ...]): The already-validated radixes
+                for `utry`.
+
+        Notes:
+            This is intended for hot paths, such as gate unitary
+            construction, where the caller guarantees `utry` is a
+            freshly allocated, writeable unitary with the correct dtype
+            and shape. The returned matrix takes ownership of `utry`, so
+            it must not be cached, shared, or modified by the caller
+            afterwards.
+        """
+        out = cls.__new__(cls)
+        out._utry = utry
+        out._radixes = radixes
+        out._dim = utry.shape[0]
+        return out
+
     @property
     def numpy(self) -> npt.NDArray[np.complex128]:
         """The NumPy array holding the unitary."""
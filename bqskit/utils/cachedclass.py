@@ -27,8 +27,8 @@ class CachedClass:
 
     Any class that inherits from CachedClass will be instantiated once per
     parameter set. Any subsequent attempts to instantiate a CachedClass with
-    the same parameters will return the same object. CachedClass is not
-    thread-safe.
+    the same parameters will return the same object. Concurrent first
+    instantiations agree on a single cached object.
 
     Examples:
         >>> x = CachedClass(1)
@@ -42,6 +42,14 @@ class CachedClass:
     _instances: dict[Any, CachedClass] = {}
 
     def __new__(cls: type[T], *args: Any, **kwargs: Any) -> T:
+        _instances = cls._instances  # type: ignore
+
+        # Fast path for parameterless classes, such as constant gates
+        if not args and not kwargs:
+            instance = _instances.get((cls, (), ()), None)
+            if instance is not None:
+                return instance
+
         hash_a = all(
             isinstance(arg, Hashable)
             and not isinstance(arg, NDArrayOperatorsMixin)
@@ -60,20 +68,21 @@ class CachedClass:
 
         key = (cls, args, tuple(kwargs.items()))
 
-        _instances = cls._instances  # type: ignore
-
-        if _instances.get(key, None) is None:
-            _logger.debug(
-                (
+        instance = _instances.get(key, None)
+        if instance is None:
+            if _logger.isEnabledFor(logging.DEBUG):
+                _logger.debug(
                     'Creating cached instance for class: %s,'
                     ' with args %s, and kwargs %s'
+                    % (cls.__name__, args, kwargs),
                 )
-                % (cls.__name__, args, kwargs),
-            )
-            _instances[key] = object.__new__(cls)
-            _instances[key].__cache_key__ = (cls, args, kwargs)
+            obj = object.__new__(cls)
+            obj.__cache_key__ = (cls, args, kwargs)  # type: ignore
+
+            # setdefault is atomic, so racing threads agree on one instance
+            instance = _instances.setdefault(key, obj)
 
-        return _instances[key]
+        return instance
 
     def __copy__(self) -> CachedClass:
         return self
@@ -81,6 +81,7 @@ def dexpmv(
 def softmax(
     x: npt.NDArray[np.float64],
     beta: int = 20,
+    axis: int | None = None,
 ) -> npt.NDArray[np.float64]:
     """
     Computes the softmax of vector x.
@@ -90,13 +91,16 @@ def softmax(
 
         beta (int): Beta coefficient to scale steepness of softmax.
 
+        axis (int | None): The axis to normalize along. If None, the
+            softmax is taken over all elements of `x`. (Default: None)
+
     Returns:
         np.ndarray: Output vector of softmax.
     """
 
-    shiftx = beta * (x - np.max(x))
+    shiftx = beta * (x - np.max(x, axis=axis, keepdims=True))
     exps = np.exp(shiftx)
-    return exps / np.sum(exps)
+    return exps / np.sum(exps, axis=axis, keepdims=True)
 
 
 def dot_product(alpha: RealVector, sigma: RealVector) -> npt.NDArray[Any]:
@@ -98,23 +98,21 @@ def is_valid_radixes(
     if not is_sequence(radixes):
         return False
 
-    if not all([is_integer(qudit) for qudit in radixes]):
-        fail_idx = [is_integer(qudit) for qudit in radixes].index(False)
-        _logger.debug(
-            'Radixes is not a tuple of ints, got: %s.' % type(
-                radixes[fail_idx],
-            ),
-        )
-        return False
-
-    if not all([radix >= 2 for radix in radixes]):
-        _logger.debug('Radixes invalid; radix indices must be >= 2.')
-        return False
-
     if num_qudits is not None and len(radixes) != num_qudits:
         _logger.debug('Invalid number of radixes.')
         return False
 
+    for radix in radixes:
+        if not is_integer(radix):
+            _logger.debug(
+                'Radixes is not a tuple of ints, got: %s.' % type(radix),
+            )
+            return False
+
+        if radix < 2:
+            _logger.debug('Radixes invalid; radix indices must be >= 2.')
+            return False
+
     return True
 
 
@@ -302,6 +302,27 @@ class TestGetNumParams:
         assert circuit.num_params == 6
         circuit.freeze_param(0)
 
+    def test_freezing_params(self) -> None:
+        circuit = Circuit(2)
+        circuit.append_gate(U3Gate(), [0], [0.1, 0.2, 0.3])
+        circuit.append_gate(CNOTGate(), [0, 1])
+        circuit.append_gate(U3Gate(), [1], [0.4, 0.5, 0.6])
+        utry = circuit.get_unitary()
+        circuit.freeze_params([0, 2, 4])
+        assert circuit.num_params == 3
+        assert circuit.num_operations == 3
+        assert np.allclose(circuit.params, [0.2, 0.4, 0.6])
+        assert circuit.get_unitary() == utry
+
+    def test_freezing_params_invalid(self) -> None:
+        circuit = Circuit(1)
+        circuit.append_gate(U3Gate(), [0])
+        with pytest.raises(IndexError):
+            circuit.freeze_params([3])
+        with pytest.raises(IndexError):
+            circuit.freeze_params([-1])
+        assert circuit.num_params == 3
+
     def test_r1(self, r3_qubit_circuit: Circuit) -> None:
         start = r3_qubit_circuit.num_params
         r3_qubit_circuit.append_gate(U3Gate(), [0])
@@ -377,6 +398,17 @@ class TestGetDim:
         circuit = Circuit(4, [2, 2, 3, 3])
         assert circuit.dim == 36
 
+    def test_qudit_methods(self) -> None:
+        circuit = Circuit(2)
+        circuit.append_qudit(3)
+        assert circuit.dim == 12
+        circuit.insert_qudit(0, 5)
+        assert circuit.dim == 60
+        circuit.pop_qudit(2)
+        assert circuit.dim == 30
+        circuit.become(Circuit(3, [3, 3, 3]))
+        assert circuit.dim == 27
+
 
 class TestIsQubitOnly:
     """This tests `circuit.is_qubit_only`."""
@@ -631,6 +663,13 @@ class TestGetParams:
         circuit = Circuit(4, [2, 3, 4, 5])
         assert len(circuit.params) == 0
 
+    def test_order(self) -> None:
+        circuit = Circuit(2)
+        circuit.append_gate(U3Gate(), [0], [1, 2, 3])
+        circuit.append_gate(CNOTGate(), [0, 1])
+        circuit.append_gate(U3Gate(), [1], [4, 5, 6])
+        assert np.array_equal(circuit.params, [1, 2, 3, 4, 5, 6])
+
 
 class TestGetDepth:
     """This tests `circuit.depth`."""
@@ -698,6 +737,35 @@ class TestGetDepth:
         circuit.remove(U3Gate())
         assert circuit.depth == 0
 
+    def test_copy_become_clear(self) -> None:
+        circuit = Circuit(2)
+        circuit.append_gate(U3Gate(), [0])
+        circuit.append_gate(CNOTGate(), [0, 1])
+        assert circuit.depth == 2
+        other = circuit.copy()
+        other.append_gate(U3Gate(), [1])
+        assert other.depth == 3
+        assert circuit.depth == 2
+        circuit.become(other)
+        assert circuit.depth == 3
+        assert circuit.num_operations == 3
+        assert circuit.num_params == 6
+        circuit.clear()
+        assert circuit.depth == 0
+        assert circuit.num_operations == 0
+        assert circuit.num_params == 0
+
+    def test_renumber_qudits(self) -> None:
+        circuit = Circuit(3)
+        circuit.append_gate(U3Gate(), [0])
+        circuit.append_gate(U3Gate(), [0])
+        assert circuit.depth == 2
+        circuit.renumber_qudits([2, 0, 1])
+        circuit.append_gate(U3Gate(), [2])
+        assert circuit.depth == 3
+        circuit.append_gate(U3Gate(), [0])
+        assert circuit.depth == 3
+
     def test_vs_cycles(self, r6_qudit_circuit: Circuit) -> None:
         assert (
             r6_qudit_circuit.depth
@@ -717,6 +785,7 @@ class TestGetParallelism:
     def test_empty(self) -> None:
         circuit = Circuit(1)
         assert circuit.parallelism == 0
+        assert isinstance(circuit.parallelism, float)
         circuit = Circuit(4)
         assert circuit.parallelism == 0
         circuit = Circuit(4, [2, 3, 4, 5])
@@ -758,6 +827,19 @@ class TestGetParallelism:
         circuit.append_gate(CNOTGate(), [0, 1])
         assert circuit.parallelism == 2
 
+    def test_removing_gate(self) -> None:
+        circuit = Circuit(2)
+        circuit.append_gate(U3Gate(), [0])
+        circuit.append_gate(U3Gate(), [1])
+        circuit.append_gate(CNOTGate(), [0, 1])
+        assert circuit.parallelism == 2
+        circuit.remove(CNOTGate())
+        assert circuit.parallelism == 2
+        circuit.remove(U3Gate())
+        assert circuit.parallelism == 1
+        circuit.remove(U3Gate())
+        assert circuit.parallelism == 0
+
 
 class TestGetCouplingGraph:
     """This tests `circuit.coupling_graph`."""
@@ -914,6 +996,20 @@ class TestGetCouplingGraph:
         assert (1, 2) in cgraph
         assert (4, 5) in cgraph
 
+    def test_removing_gate(self) -> None:
+        circuit = Circuit(3)
+        circuit.append_gate(CNOTGate(), [0, 1])
+        circuit.append_gate(CNOTGate(), [0, 1])
+        circuit.append_gate(CNOTGate(), [1, 2])
+        assert len(circuit.coupling_graph) == 2
+        circuit.pop((0, 0))
+        assert len(circuit.coupling_graph) == 2
+        circuit.pop((0, 0))
+        cgraph = circuit.coupling_graph
+        assert len(cgraph) == 1
+        assert (1, 2) in cgraph
+        assert (0, 1) not in cgraph
+
 
 class TestGetGateSet:
     """This tests `circuit.gate_set`."""
@@ -1008,6 +1104,15 @@ class TestGetGateSet:
         assert TGate() in circuit.gate_set
         assert CSUMGate() in circuit.gate_set
 
+    def test_replace_and_clear(self) -> None:
+        circuit = Circuit(1)
+        circuit.append_gate(XGate(), [0])
+        assert circuit.gate_set == GateSet(XGate())
+        circuit.replace_gate((0, 0), ZGate(), [0])
+        assert circuit.gate_set == GateSet(ZGate())
+        circuit.clear()
+        assert len(circuit.gate_set) == 0
+
 
 def test_active_qudits() -> None:
     # Create a circuit with 3 qudits and 3 gates
@@ -1048,6 +1153,19 @@ def test_active_qudits() -> None:
     assert circuit5.active_qudits == [0]
 
 
+def test_gate_counts() -> None:
+    circuit = Circuit(2)
+    assert circuit.gate_counts == {}
+    circuit.append_gate(HGate(), 0)
+    circuit.append_gate(CNOTGate(), [0, 1])
+    circuit.append_gate(HGate(), 1)
+    assert circuit.gate_counts == {HGate(): 2, CNOTGate(): 1}
+    circuit.remove(CNOTGate())
+    assert circuit.gate_counts == {HGate(): 2}
+    circuit.gate_counts[HGate()] = 5
+    assert circuit.count(HGate()) == 2
+
+
 class TestIsDifferentiable:
     """This tests `circuit.is_differentiable`."""
 
@@ -4,6 +4,9 @@ from __future__ import annotations
 import numpy as np
 
 from bqskit.ir.circuit import Circuit
+from bqskit.ir.gates import CZGate
+from bqskit.ir.gates import HGate
+from bqskit.ir.gates import U3Gate
 from bqskit.qis.unitary import UnitaryMatrix
 
 
@@ -19,3 +22,18 @@ def test_fuzz_simulation(r6_qudit_circuit: Circuit) -> None:
     utry = (r6_qudit_circuit + r6_qudit_circuit.get_inverse()).get_unitary()
     identity = np.identity(r6_qudit_circuit.dim)
     assert np.allclose(utry, identity)
+
+
+def test_cz_statevector_matches_unitary() -> None:
+    circuit = Circuit(3)
+    circuit.append_gate(HGate(), 0)
+    circuit.append_gate(HGate(), 2)
+    circuit.append_gate(CZGate(), (2, 0))
+    circuit.append_gate(U3Gate(), 1)
+    circuit.append_gate(CZGate(), (1, 2))
+    params = np.random.rand(circuit.num_params)
+    in_state = np.zeros(circuit.dim, dtype=np.complex128)
+    in_state[0] = 1
+    expected = circuit.get_unitary(params) @ in_state
+    out_state = circuit.get_statevector(in_state, params)
+    assert np.allclose(out_state, expected)
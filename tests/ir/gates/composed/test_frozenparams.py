@@ -15,3 +15,13 @@ def test_u3_rx(angle: float) -> None:
     frozen_u3 = FrozenParameterGate(U3Gate(), {1: -np.pi / 2, 2: np.pi / 2})
     assert frozen_u3.get_unitary([angle]) == RXGate().get_unitary([angle])
     assert frozen_u3.num_params == 1
+
+
+def test_get_grad_matches_full_gradient() -> None:
+    full = np.array([0.1, 0.2, 0.3])
+    full_grad = U3Gate().get_grad(full)
+    for frozen in [{0: 0.1}, {1: 0.2}, {2: 0.3}, {0: 0.1, 2: 0.3}]:
+        gate = FrozenParameterGate(U3Gate(), frozen)
+        free = [i for i in range(3) if i not in frozen]
+        assert np.allclose(gate.get_full_params(full[free]), full)
+        assert np.allclose(gate.get_grad(full[free]), full_grad[free])
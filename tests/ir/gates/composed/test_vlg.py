@@ -1,8 +1,11 @@
 """This module tests the VariableLocationGate class."""
 from __future__ import annotations
 
+import numpy as np
 from hypothesis import given
 
+from bqskit.ir.gates import CNOTGate
+from bqskit.ir.gates import CRXGate
 from bqskit.ir.gates import VariableLocationGate
 from bqskit.ir.gates.constant.unitary import ConstantUnitaryGate
 from bqskit.qis.unitary.unitarymatrix import UnitaryMatrix
@@ -18,3 +21,52 @@ def test_vlg(utry: UnitaryMatrix) -> None:
     IU = UnitaryMatrix.identity(2).otimes(utry)
     assert vlg.get_unitary([100, 0]).get_distance_from(UI) < 1e-7
     assert vlg.get_unitary([0, 100]).get_distance_from(IU) < 1e-7
+
+
+def test_vlg_unitary_and_grad() -> None:
+    vlg = VariableLocationGate(CRXGate(), [(0, 1), (1, 2), (2, 0)])
+    params = np.array([0.3, 0.1, 0.5, -0.2])
+    utry, grad = vlg.get_unitary_and_grad(params)
+    assert utry.get_distance_from(vlg.get_unitary(params)) < 1e-7
+    assert grad.shape == (4, 8, 8)
+
+    # Compare against finite differences of the unprojected unitary
+    def raw(params: np.ndarray) -> np.ndarray:
+        a, l = vlg.split_params(params)
+        l = np.exp(10 * l) / np.sum(np.exp(10 * l))
+        P = np.einsum('i,ijk->jk', l, vlg.perms)
+        G = np.kron(vlg.gate.get_unitary(a), vlg.I)
+        return P.T @ G @ P
+
+    eps = 1e-6
+    for i in range(vlg.num_params):
+        shift = np.zeros(vlg.num_params)
+        shift[i] = eps
+        fd = (raw(params + shift) - raw(params - shift)) / (2 * eps)
+        assert np.allclose(grad[i], fd, atol=1e-5)
+
+
+def test_vlg_constant_gate_grad() -> None:
+    vlg = VariableLocationGate(CNOTGate(), [(0, 1), (1, 2)])
+    utry, grad = vlg.get_unitary_and_grad([0, 100])
+    assert utry.get_distance_from(vlg.get_unitary([0, 100])) < 1e-7
+    assert grad.shape == (2, 8, 8)
+
+
+def test_vlg_get_location() -> None:
+    vlg = VariableLocationGate(CRXGate(), [(0, 1), (1, 2), (2, 0)])
+    assert vlg.get_location([0.5, 0, 1, 0]) == (1, 2)
+    assert vlg.get_location(np.array([0.5, 3, 1, 0])) == (0, 1)
+
+
+def test_vlg_unitary_and_grad_batch() -> None:
+    vlg = VariableLocationGate(CRXGate(), [(0, 1), (1, 2), (2, 0)])
+    params_batch = np.random.default_rng(0).uniform(-1, 1, (5, 4))
+    U, dU = vlg.get_unitary_and_grad_batch(params_batch)
+    assert U.shape == (5, 8, 8)
+    assert dU.shape == (5, 4, 8, 8)
+    assert np.allclose(vlg.get_unitary_batch(params_batch), U)
+    for i, params in enumerate(params_batch):
+        utry, grad = vlg.get_unitary_and_grad(params)
+        assert np.allclose(U[i], utry)
+        assert np.allclose(dU[i], grad)
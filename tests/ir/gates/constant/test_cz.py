@@ -0,0 +1,22 @@
+"""This module tests the CZGate class."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from bqskit.ir.gates import CNOTGate
+from bqskit.ir.gates import CZGate
+from bqskit.ir.gates import U3Gate
+
+
+def test_diagonal_is_read_only() -> None:
+    diagonal = CZGate().diagonal
+    assert diagonal is not None
+    assert np.array_equal(diagonal, np.diag(CZGate().get_unitary()))
+    with pytest.raises(ValueError):
+        diagonal[0] = 0
+
+
+def test_non_diagonal_gates() -> None:
+    assert CNOTGate().diagonal is None
+    assert U3Gate().diagonal is None
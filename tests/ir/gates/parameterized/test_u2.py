@@ -20,3 +20,39 @@ def test_get_unitary(angle1: float, angle2: float) -> None:
     y = RYGate().get_unitary([np.pi / 2])
     z2 = RZGate().get_unitary([angle2])
     assert u.get_distance_from(z1 @ y @ z2) < 1e-7
+
+
+def test_get_unitary_and_grad_batch() -> None:
+    params_batch = np.random.default_rng(0).uniform(-np.pi, np.pi, (8, 2))
+    U = U2Gate().get_unitary_batch(params_batch)
+    dU = U2Gate().get_grad_batch(params_batch)
+    assert U.shape == (8, 2, 2)
+    assert dU.shape == (8, 2, 2, 2)
+    for i, params in enumerate(params_batch):
+        assert np.allclose(U[i], U2Gate().get_unitary(params))
+        assert np.allclose(dU[i], U2Gate().get_grad(params))
+
+
+def test_get_unitary_is_fresh_and_writeable() -> None:
+    u1 = U2Gate().get_unitary([0.5, 0.25])
+    u2 = U2Gate().get_unitary([0.5, 0.25])
+    assert u1.numpy is not u2.numpy
+    assert u1.numpy.flags.writeable
+
+
+@given(
+    floats(-np.pi, np.pi),
+    floats(-np.pi, np.pi),
+)
+def test_get_grad(angle1: float, angle2: float) -> None:
+    params = [angle1, angle2]
+    utry, grad = U2Gate().get_unitary_and_grad(params)
+    assert np.allclose(grad, U2Gate().get_grad(params))
+    assert np.allclose(utry, U2Gate().get_unitary(params))
+
+    eps = 1e-7
+    for i in range(2):
+        shifted = list(params)
+        shifted[i] += eps
+        fd = (U2Gate().get_unitary(shifted) - utry) / eps
+        assert np.allclose(grad[i], fd, atol=1e-5)
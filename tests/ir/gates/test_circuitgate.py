@@ -42,3 +42,11 @@ class TestPickle:
         utry = circuit.get_unitary()
         pickled = pickle.loads(pickle.dumps(circuit))
         assert utry == pickled.get_unitary()
+
+
+@given(circuits([2, 2], max_gates=5))
+def test_hash(c: Circuit) -> None:
+    gate = CircuitGate(c)
+    assert hash(gate) == hash(gate)
+    assert hash(gate) == hash(CircuitGate(c))
+    assert hash(pickle.loads(pickle.dumps(gate))) == hash(gate)
@@ -55,3 +55,12 @@ class TestIntersection:
         assert len(intersection) <= len(CircuitLocation(l2))
         assert all(x in l1 for x in intersection)
         assert all(x in CircuitLocation(l2) for x in intersection)
+
+
+class TestPairs:
+    @given(circuit_locations())
+    def test_pairs(self, loc: CircuitLocation) -> None:
+        pairs = loc.pairs
+        assert len(pairs) == len(loc) * (len(loc) - 1) // 2
+        assert all(q1 < q2 and q1 in loc and q2 in loc for q1, q2 in pairs)
+        assert loc.pairs is pairs
@@ -7,6 +7,7 @@ from hypothesis.strategies import floats
 
 from bqskit.qis.state.state import StateLike
 from bqskit.qis.state.state import StateVector
+from bqskit.qis.unitary.unitarymatrix import UnitaryMatrix
 from bqskit.utils.test.strategies import num_qudits_and_radixes
 from bqskit.utils.test.strategies import state_likes
 from bqskit.utils.test.strategies import state_vectors
@@ -36,6 +37,25 @@ def test_properties(vec: StateVector) -> None:
     assert int(np.prod(vec.radixes)) == vec.dim
 
 
+@given(state_vectors())
+def test_get_probs(vec: StateVector) -> None:
+    probs = vec.get_probs()
+    assert probs.shape == (vec.dim,)
+    assert np.allclose(probs, np.abs(vec.numpy) ** 2)
+    assert np.isclose(np.sum(probs), 1)
+
+
+def test_apply_diagonal() -> None:
+    for location in [(0, 1), (1, 0), (1, 2), (2, 0)]:
+        vec = StateVector.random(3, [2, 3, 2])
+        radixes = [vec.radixes[q] for q in location]
+        diag = np.exp(1j * np.arange(int(np.prod(radixes))))
+        expected = StateVector(vec)
+        expected.apply(UnitaryMatrix(np.diag(diag), radixes), location)
+        vec.apply_diagonal(diag, location)
+        assert np.allclose(vec, expected)
+
+
 @given(state_likes(3))
 def test_is_unitary(v: StateLike) -> None:
     assert StateVector.is_pure_state(v)
@@ -63,3 +63,10 @@ class TestMachineGetSubgraph:
 
         with pytest.raises(TypeError):
             coupling_graph.get_subgraph('a')  # type: ignore
+
+
+def test_hash_independent_of_edge_order() -> None:
+    g1 = CouplingGraph([(0, 1), (1, 2), (2, 3), (3, 0)])
+    g2 = CouplingGraph([(3, 0), (3, 2), (2, 1), (1, 0)])
+    assert g1 == g2
+    assert hash(g1) == hash(g2)
@@ -29,3 +29,11 @@ def test_cachedclass_kwarg() -> None:
     c = Kwarg(default=0)
     assert a is b
     assert a is not c
+
+
+class NoArg(CachedClass):
+    pass
+
+
+def test_cachedclass_no_arg() -> None:
+    assert NoArg() is NoArg()
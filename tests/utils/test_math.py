@@ -116,6 +116,13 @@ class TestSoftmax:
         x[5] = 2
         assert np.argmax(softmax(x)) == 5
 
+    def test_axis(self) -> None:
+        x = np.random.random((5, 7))
+        out = softmax(x, 10, axis=1)
+        assert np.allclose(np.sum(out, axis=1), 1)
+        for row, out_row in zip(x, out):
+            assert np.allclose(out_row, softmax(row, 10))
+
     @pytest.mark.parametrize('test_variable', ['a', False, True])
     def test_invalid(self, test_variable: Any) -> None:
         with pytest.raises(TypeError):